@@ -69,20 +69,37 @@ Configuration File:
     See config.example.json for the format.
 """
 
+from __future__ import annotations
+
 import argparse
-import asyncio
 import json
+import os
 import re
+import shlex
+import shutil
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional, cast
+
+if TYPE_CHECKING:
+    from kryten import KrytenClient
+
 
-from kryten import KrytenClient
+# Media URL patterns, one alternation so a URL is scanned once.
+# Group names are CyTube media types ("yt_id" is a bare YouTube ID).
+_MEDIA_URL = re.compile(
+    r'(?:youtube\.com/watch\?v=|youtu\.be/)(?P<yt>[a-zA-Z0-9_-]{11})'
+    r'|^(?P<yt_id>[a-zA-Z0-9_-]{11})$'
+    r'|vimeo\.com/(?P<vm>\d+)'
+    r'|dailymotion\.com/video/(?P<dm>[a-zA-Z0-9]+)'
+)
 
 
 class KrytenCLI:
     """Command-line interface for Kryten CyTube commands."""
     
+    __slots__ = ("channel", "domain", "client", "config_dict")
+    
     def __init__(
         self,
         channel: str,
@@ -98,8 +115,8 @@ class KrytenCLI:
             nats_servers: NATS server URLs (default: ["nats://localhost:4222"]).
             config_path: Optional path to configuration file (overrides defaults).
         """
-        self.channel = channel
-        self.domain = domain
+        self.channel: str = channel
+        self.domain: str = domain
         self.client: Optional[KrytenClient] = None
         
         # Build config dict from command-line args or config file
@@ -110,16 +127,11 @@ class KrytenCLI:
             if nats_servers is None:
                 nats_servers = ["nats://localhost:4222"]
             
+            # Channels are filled in by _client_config() at connect time
             self.config_dict = {
                 "nats": {
                     "servers": nats_servers
-                },
-                "channels": [
-                    {
-                        "domain": domain,
-                        "channel": channel
-                    }
-                ]
+                }
             }
     
     def _load_config(self, config_path: str) -> dict:
@@ -134,28 +146,93 @@ class KrytenCLI:
         Raises:
             SystemExit: If config file is invalid.
         """
+        path = Path(config_path)
+        
         try:
-            with Path(config_path).open("r", encoding="utf-8") as f:
-                config = json.load(f)
-                
-            # Ensure channels list exists for kryten-py
-            if "channels" not in config and "cytube" in config:
-                # Convert legacy format
-                cytube = config["cytube"]
-                config["channels"] = [{
-                    "domain": cytube.get("domain", "cytu.be"),
-                    "channel": cytube["channel"]
-                }]
-                
-            return config
+            # Single read; json.loads detects UTF-8/16/32 from the raw bytes
+            config = json.loads(path.read_bytes())
         except json.JSONDecodeError as e:
             print(f"Error: Invalid JSON in config file: {e}", file=sys.stderr)
             sys.exit(1)
+        
+        # Ensure channels list exists for kryten-py
+        if "channels" not in config:
+            self._upgrade_legacy(path, config)
+        
+        return config
+    
+    @staticmethod
+    def _upgrade_legacy(path: Path, config: dict) -> None:
+        """Convert a legacy ``cytube`` config and save it back to disk.
+        
+        The original file is kept as ``<name>.bak``. The conversion happens
+        once; later runs find the ``channels`` list already present.
+        
+        Args:
+            path: Path to configuration file.
+            config: Parsed configuration, updated in place.
+        """
+        if "cytube" not in config:
+            return
+        
+        # Convert legacy format
+        cytube = config["cytube"]
+        config["channels"] = [{
+            "domain": cytube.get("domain", "cytu.be"),
+            "channel": cytube["channel"]
+        }]
+        
+        # Rewrite the file a symlink points to, so the link itself survives
+        target = path.resolve()
+        
+        # Best effort: an unwritable config is simply converted again next run
+        backup_path = target.with_name(f"{target.name}.bak")
+        tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            shutil.copy2(target, backup_path)
+            # Private until it has the original's mode; configs may hold passwords
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(config, indent=2) + "\n")
+            shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return
+        
+        print(
+            f"Note: Upgraded legacy config format in {path} (backup: {backup_path})",
+            file=sys.stderr,
+        )
+    
+    def _client_config(self) -> dict:
+        """Build the kryten-py config for this invocation.
+        
+        Only the channel being commanded is passed on, so the client does not
+        validate or subscribe to every channel in a shared config file. The
+        legacy ``cytube`` section is dropped as well.
+        
+        Returns:
+            Configuration dictionary for KrytenClient.
+        """
+        config = {
+            key: value for key, value in self.config_dict.items()
+            if key not in ("channels", "cytube")
+        }
+        channels = [{"domain": self.domain, "channel": self.channel}]
+        if not self.channel:
+            # Channel not known yet (auto-discovery); use whatever is configured
+            channels = self.config_dict.get("channels") or channels
+        config["channels"] = channels
+        return config
     
     async def connect(self) -> None:
         """Connect to NATS server using kryten-py client."""
         try:
-            self.client = KrytenClient(self.config_dict)
+            # Deferred so --help and usage errors never load the NATS stack
+            from kryten import KrytenClient
+            
+            self.client = KrytenClient(self._client_config())
             await self.client.connect()
         except OSError as e:
             # Network/hostname errors
@@ -185,29 +262,16 @@ class KrytenCLI:
         Returns:
             Tuple of (media_type, media_id)
         """
-        # YouTube patterns
-        yt_patterns = [
-            r'(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})',
-            r'^([a-zA-Z0-9_-]{11})$'  # Direct ID
-        ]
-        
-        for pattern in yt_patterns:
-            match = re.search(pattern, url)
-            if match:
-                return ("yt", match.group(1))
-        
-        # Vimeo
-        vimeo_match = re.search(r'vimeo\.com/(\d+)', url)
-        if vimeo_match:
-            return ("vm", vimeo_match.group(1))
-        
-        # Dailymotion
-        dm_match = re.search(r'dailymotion\.com/video/([a-zA-Z0-9]+)', url)
-        if dm_match:
-            return ("dm", dm_match.group(1))
+        # YouTube, Vimeo, Dailymotion
+        match = _MEDIA_URL.search(url)
+        if match:
+            # Every alternative has exactly one named group
+            media_type = cast(str, match.lastgroup)
+            return ("yt" if media_type == "yt_id" else media_type, match.group(media_type))
         
         # CyTube Custom Media JSON manifest (must end with .json)
-        if url.lower().endswith('.json') or '.json?' in url.lower():
+        lo = url.lower()
+        if lo.endswith('.json') or '.json?' in lo:
             return ("cm", url)
         
         # Default: custom URL (for direct video files, custom embeds, etc.)
@@ -270,12 +334,13 @@ class KrytenCLI:
         Args:
             uid: Video UID or position number (1-based).
         """
+        channel, domain = self.channel, self.domain
         uid_int = int(uid)
         
         # If uid looks like a position (small number), fetch playlist and map position to UID
         # CyTube UIDs are typically 4+ digits, positions are 1-based small numbers
         if uid_int < 1000:  # Assume this is a position, not a UID
-            bucket_name = f"cytube_{self.channel.lower()}_playlist"
+            bucket_name = f"cytube_{channel.lower()}_playlist"
             try:
                 playlist = await self.client.kv_get(bucket_name, "items", default=None, parse_json=True)
                 
@@ -295,7 +360,7 @@ class KrytenCLI:
                     print(f"Could not find UID for position {uid_int}", file=sys.stderr)
                     sys.exit(1)
                 
-                await self.client.delete_media(self.channel, actual_uid, domain=self.domain)
+                await self.client.delete_media(channel, actual_uid, domain=domain)
                 title = item.get("media", {}).get("title", "Unknown")
                 print(f"✓ Deleted position {uid_int} (UID {actual_uid}): {title}")
             
@@ -304,8 +369,8 @@ class KrytenCLI:
                 sys.exit(1)
         else:
             # Large number, treat as direct UID
-            await self.client.delete_media(self.channel, uid_int, domain=self.domain)
-            print(f"✓ Deleted media UID {uid} from {self.channel}")
+            await self.client.delete_media(channel, uid_int, domain=domain)
+            print(f"✓ Deleted media UID {uid} from {channel}")
     
     async def cmd_playlist_move(self, uid: str, after: str) -> None:
         """Move video in playlist.
@@ -314,11 +379,12 @@ class KrytenCLI:
             uid: Video UID or position to move.
             after: UID or position to place after.
         """
+        channel, domain = self.channel, self.domain
         uid_int = int(uid)
         after_int = int(after)
         
         # Map positions to UIDs if needed (same logic as delete)
-        bucket_name = f"cytube_{self.channel.lower()}_playlist"
+        bucket_name = f"cytube_{channel.lower()}_playlist"
         
         try:
             playlist = await self.client.kv_get(bucket_name, "items", default=None, parse_json=True)
@@ -349,8 +415,8 @@ class KrytenCLI:
                     print(f"Could not find UID for position {after_int}", file=sys.stderr)
                     sys.exit(1)
             
-            await self.client.move_media(self.channel, actual_uid, actual_after, domain=self.domain)
-            print(f"✓ Moved media {uid} after {after} in {self.channel}")
+            await self.client.move_media(channel, actual_uid, actual_after, domain=domain)
+            print(f"✓ Moved media {uid} after {after} in {channel}")
         
         except Exception as e:
             print(f"Error moving media: {e}", file=sys.stderr)
@@ -586,9 +652,273 @@ class KrytenCLI:
             sys.exit(1)
 
 
-def create_parser() -> argparse.ArgumentParser:
+def _build_say(subparsers: argparse._SubParsersAction) -> None:
+    say_parser = subparsers.add_parser("say", help="Send a chat message")
+    say_parser.add_argument("message", help="Message text")
+
+
+def _build_pm(subparsers: argparse._SubParsersAction) -> None:
+    pm_parser = subparsers.add_parser("pm", help="Send a private message")
+    pm_parser.add_argument("username", help="Target username")
+    pm_parser.add_argument("message", help="Message text")
+
+
+def _build_playlist(subparsers: argparse._SubParsersAction) -> None:
+    playlist_parser = subparsers.add_parser("playlist", help="Playlist management")
+    playlist_subparsers = playlist_parser.add_subparsers(dest="playlist_cmd")
+    
+    add_parser = playlist_subparsers.add_parser("add", help="Add video to end")
+    add_parser.add_argument("url", help="Video URL or ID")
+    
+    addnext_parser = playlist_subparsers.add_parser("addnext", help="Add video to play next")
+    addnext_parser.add_argument("url", help="Video URL or ID")
+    
+    del_parser = playlist_subparsers.add_parser("del", help="Delete video")
+    del_parser.add_argument("uid", help="Video UID or position")
+    
+    move_parser = playlist_subparsers.add_parser("move", help="Move video")
+    move_parser.add_argument("uid", help="Video UID to move")
+    move_parser.add_argument("after", help="UID to place after")
+    
+    jump_parser = playlist_subparsers.add_parser("jump", help="Jump to video")
+    jump_parser.add_argument("uid", help="Video UID")
+    
+    playlist_subparsers.add_parser("clear", help="Clear playlist")
+    playlist_subparsers.add_parser("shuffle", help="Shuffle playlist")
+    
+    settemp_parser = playlist_subparsers.add_parser("settemp", help="Set temp status")
+    settemp_parser.add_argument("uid", help="Video UID")
+    settemp_parser.add_argument("temp", choices=["true", "false"], help="Temporary status")
+
+
+def _build_pause(subparsers: argparse._SubParsersAction) -> None:
+    subparsers.add_parser("pause", help="Pause playback")
+
+
+def _build_play(subparsers: argparse._SubParsersAction) -> None:
+    subparsers.add_parser("play", help="Resume playback")
+
+
+def _build_seek(subparsers: argparse._SubParsersAction) -> None:
+    seek_parser = subparsers.add_parser("seek", help="Seek to timestamp")
+    seek_parser.add_argument("time", type=float, help="Time in seconds")
+
+
+def _build_kick(subparsers: argparse._SubParsersAction) -> None:
+    kick_parser = subparsers.add_parser("kick", help="Kick user")
+    kick_parser.add_argument("username", help="Username to kick")
+    kick_parser.add_argument("reason", nargs="?", help="Kick reason")
+
+
+def _build_ban(subparsers: argparse._SubParsersAction) -> None:
+    ban_parser = subparsers.add_parser("ban", help="Ban user")
+    ban_parser.add_argument("username", help="Username to ban")
+    ban_parser.add_argument("reason", nargs="?", help="Ban reason")
+
+
+def _build_voteskip(subparsers: argparse._SubParsersAction) -> None:
+    subparsers.add_parser("voteskip", help="Vote to skip current video")
+
+
+def _build_list(subparsers: argparse._SubParsersAction) -> None:
+    list_parser = subparsers.add_parser("list", help="List channel information")
+    list_subparsers = list_parser.add_subparsers(dest="list_cmd")
+    
+    list_subparsers.add_parser("queue", help="Show current playlist")
+    list_subparsers.add_parser("users", help="Show online users")
+    list_subparsers.add_parser("emotes", help="Show channel emotes")
+
+
+def _build_batch(subparsers: argparse._SubParsersAction) -> None:
+    batch_parser = subparsers.add_parser("batch", help="Run commands from a file over one connection")
+    batch_parser.add_argument("file", help="File with one command per line, or - for stdin")
+
+
+# Subparser builders by command name, in help order
+_COMMANDS = {
+    # Chat commands
+    "say": _build_say,
+    "pm": _build_pm,
+    # Playlist commands
+    "playlist": _build_playlist,
+    # Playback commands
+    "pause": _build_pause,
+    "play": _build_play,
+    "seek": _build_seek,
+    # Moderation commands
+    "kick": _build_kick,
+    "ban": _build_ban,
+    "voteskip": _build_voteskip,
+    # List commands
+    "list": _build_list,
+    # Batch mode
+    "batch": _build_batch,
+}
+
+# Global options that consume the following argument, and their destinations
+_GLOBAL_VALUE_OPTIONS = {
+    "--channel": "channel",
+    "--domain": "domain",
+    "--nats": "nats_servers",
+    "--config": "config",
+}
+
+# Global options that take no argument
+_GLOBAL_FLAG_OPTIONS = {"--daemon": "daemon"}
+
+# Positional arguments for the argparse-free fast path, as (required, optional).
+# Commands with subcommands map to (dest, table for the subcommand).
+_FAST_ARGS: dict[str, Any] = {
+    "say": (("message",), ()),
+    "pm": (("username", "message"), ()),
+    "playlist": ("playlist_cmd", {
+        "add": (("url",), ()),
+        "addnext": (("url",), ()),
+        "del": (("uid",), ()),
+        "move": (("uid", "after"), ()),
+        "jump": (("uid",), ()),
+        "clear": ((), ()),
+        "shuffle": ((), ()),
+        "settemp": (("uid", "temp"), ()),
+    }),
+    "pause": ((), ()),
+    "play": ((), ()),
+    "seek": (("time",), ()),
+    "kick": (("username",), ("reason",)),
+    "ban": (("username",), ("reason",)),
+    "voteskip": ((), ()),
+    "list": ("list_cmd", {
+        "queue": ((), ()),
+        "users": ((), ()),
+        "emotes": ((), ()),
+    }),
+    "batch": (("file",), ()),
+}
+
+
+def _split_globals(argv: list[str]) -> Optional[tuple[dict, list[str]]]:
+    """Consume the global options at the start of argv.
+    
+    Args:
+        argv: Command-line arguments (without program name).
+    
+    Returns:
+        Tuple of (option values by destination, remaining arguments), or None
+        if argv contains anything this simple scan does not understand (help
+        flags, unknown or abbreviated options, missing values).
+    """
+    options: dict[str, Any] = {}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        name, sep, value = arg.partition("=")
+        if name in _GLOBAL_VALUE_OPTIONS:
+            if not sep:
+                if i + 1 >= len(argv) or argv[i + 1].startswith("-"):
+                    return None
+                value = argv[i + 1]
+                i += 1
+            dest = _GLOBAL_VALUE_OPTIONS[name]
+            if dest == "nats_servers":
+                options.setdefault(dest, []).append(value)
+            else:
+                options[dest] = value
+        elif arg in _GLOBAL_FLAG_OPTIONS:
+            options[_GLOBAL_FLAG_OPTIONS[arg]] = True
+        elif arg.startswith("-"):
+            return None
+        else:
+            break
+        i += 1
+    return options, argv[i:]
+
+
+def _peek_command(argv: list[str]) -> Optional[str]:
+    """Find the command name in argv without parsing it.
+    
+    Args:
+        argv: Command-line arguments (without program name).
+    
+    Returns:
+        The command name, or None if it cannot be determined.
+    """
+    split = _split_globals(argv)
+    if split is None or not split[1]:
+        return None
+    command = split[1][0]
+    return command if command in _COMMANDS else None
+
+
+def _fast_parse(argv: list[str]) -> Optional[argparse.Namespace]:
+    """Parse well-formed command lines without building an ArgumentParser.
+    
+    Produces the same namespace argparse would. Anything unusual (help
+    flags, wrong argument counts, values argparse would reject) returns None
+    so the full parser can handle it and report errors.
+    
+    Args:
+        argv: Command-line arguments (without program name).
+    
+    Returns:
+        Parsed arguments, or None to fall back to argparse.
+    """
+    split = _split_globals(argv)
+    if split is None or not split[1]:
+        return None
+    options, rest = split
+    
+    spec = _FAST_ARGS.get(rest[0])
+    if spec is None:
+        return None
+    
+    values = {
+        "channel": None,
+        "domain": "cytu.be",
+        "nats_servers": None,
+        "config": None,
+        "daemon": False,
+        **options,
+        "command": rest[0],
+    }
+    positionals = rest[1:]
+    
+    if isinstance(spec[0], str):
+        # Nested subcommand (playlist, list)
+        dest, table = spec
+        if not positionals or positionals[0] not in table:
+            return None
+        values[dest] = positionals[0]
+        spec = table[positionals[0]]
+        positionals = positionals[1:]
+    
+    required, optional = spec
+    if not len(required) <= len(positionals) <= len(required) + len(optional):
+        return None
+    if any(arg.startswith("-") for arg in positionals):
+        return None
+    
+    names = required + optional
+    for i, name in enumerate(names):
+        values[name] = positionals[i] if i < len(positionals) else None
+    
+    # Conversions and checks argparse would otherwise apply
+    if "time" in values:
+        try:
+            values["time"] = float(values["time"])
+        except ValueError:
+            return None
+    if values.get("temp") not in (None, "true", "false"):
+        return None
+    
+    return argparse.Namespace(**values)
+
+
+def create_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
     """Create command-line argument parser.
     
+    Args:
+        command: If given, only build the subparser for this command.
+    
     Returns:
         Configured ArgumentParser.
     """
@@ -622,213 +952,438 @@ def create_parser() -> argparse.ArgumentParser:
         help="Path to configuration file (overrides other options if present)"
     )
     
-    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
-    
-    # Chat commands
-    say_parser = subparsers.add_parser("say", help="Send a chat message")
-    say_parser.add_argument("message", help="Message text")
-    
-    pm_parser = subparsers.add_parser("pm", help="Send a private message")
-    pm_parser.add_argument("username", help="Target username")
-    pm_parser.add_argument("message", help="Message text")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Reuse a background NATS connection across invocations (also KRYTEN_DAEMON=1)"
+    )
     
-    # Playlist commands
-    playlist_parser = subparsers.add_parser("playlist", help="Playlist management")
-    playlist_subparsers = playlist_parser.add_subparsers(dest="playlist_cmd")
+    if command in _COMMANDS:
+        # Usage errors still list every command, as with the full tree
+        subparsers = parser.add_subparsers(
+            dest="command",
+            metavar="{" + ",".join(_COMMANDS) + "}",
+            help="Command to execute",
+        )
+        _COMMANDS[command](subparsers)
+    else:
+        subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+        for build in _COMMANDS.values():
+            build(subparsers)
     
-    add_parser = playlist_subparsers.add_parser("add", help="Add video to end")
-    add_parser.add_argument("url", help="Video URL or ID")
+    return parser
+
+
+def _help_cache_path() -> Path:
+    """Get the per-user help cache file for the current terminal width.
     
-    addnext_parser = playlist_subparsers.add_parser("addnext", help="Add video to play next")
-    addnext_parser.add_argument("url", help="Video URL or ID")
+    Returns:
+        Path under ``$XDG_CACHE_HOME/kryten-cli`` (default ``~/.cache``).
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    columns = shutil.get_terminal_size().columns
+    return Path(cache_home) / "kryten-cli" / f"help-{columns}.json"
+
+
+def _render_help(command: Optional[str]) -> str:
+    """Render help text with argparse, building only the parsers needed.
     
-    del_parser = playlist_subparsers.add_parser("del", help="Delete video")
-    del_parser.add_argument("uid", help="Video UID or position")
+    Args:
+        command: Command whose help to render, or None for the top level.
     
-    move_parser = playlist_subparsers.add_parser("move", help="Move video")
-    move_parser.add_argument("uid", help="Video UID to move")
-    move_parser.add_argument("after", help="UID to place after")
+    Returns:
+        Help text as argparse would print it.
+    """
+    if command is None:
+        return create_parser().format_help()
     
-    jump_parser = playlist_subparsers.add_parser("jump", help="Jump to video")
-    jump_parser.add_argument("uid", help="Video UID")
+    for action in create_parser(command)._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            return action.choices[command].format_help()
+    raise KeyError(command)
+
+
+def _cached_help(command: Optional[str]) -> str:
+    """Get help text from the per-user cache, rendering it on a miss.
     
-    playlist_subparsers.add_parser("clear", help="Clear playlist")
-    playlist_subparsers.add_parser("shuffle", help="Shuffle playlist")
+    Entries are keyed by this module's mtime and the Python version (which
+    affects argparse formatting); a stale file is discarded.
     
-    settemp_parser = playlist_subparsers.add_parser("settemp", help="Set temp status")
-    settemp_parser.add_argument("uid", help="Video UID")
-    settemp_parser.add_argument("temp", choices=["true", "false"], help="Temporary status")
+    Args:
+        command: Command whose help to return, or None for the top level.
     
-    # Playback commands
-    subparsers.add_parser("pause", help="Pause playback")
-    subparsers.add_parser("play", help="Resume playback")
+    Returns:
+        Help text.
+    """
+    key = f"{Path(__file__).stat().st_mtime_ns}:{sys.version_info[0]}.{sys.version_info[1]}"
+    name = command or ""
     
-    seek_parser = subparsers.add_parser("seek", help="Seek to timestamp")
-    seek_parser.add_argument("time", type=float, help="Time in seconds")
+    try:
+        path = _help_cache_path()
+    except (KeyError, RuntimeError):
+        # No home directory to cache in
+        return _render_help(command)
     
-    # Moderation commands
-    kick_parser = subparsers.add_parser("kick", help="Kick user")
-    kick_parser.add_argument("username", help="Username to kick")
-    kick_parser.add_argument("reason", nargs="?", help="Kick reason")
+    static: dict = {"key": key, "help": {}}
+    try:
+        cached = json.loads(path.read_bytes())
+        if isinstance(cached, dict) and cached.get("key") == key and isinstance(cached.get("help"), dict):
+            static = cached
+    except (OSError, ValueError):
+        # Missing or corrupt cache
+        pass
+    
+    text = static["help"].get(name)
+    if text is not None:
+        return text
+    
+    text = _render_help(command)
+    static["help"][name] = text
+    
+    # Best effort: the cache directory may not be writable
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(static), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
     
-    ban_parser = subparsers.add_parser("ban", help="Ban user")
-    ban_parser.add_argument("username", help="Username to ban")
-    ban_parser.add_argument("reason", nargs="?", help="Ban reason")
+    return text
+
+
+def print_from_static(argv: list[str]) -> bool:
+    """Print cached help text without building the parser.
     
-    subparsers.add_parser("voteskip", help="Vote to skip current video")
+    Handles ``kryten``, ``kryten --help`` and ``kryten COMMAND --help``.
+    Anything else, including errors, is left to argparse.
     
-    # List commands
-    list_parser = subparsers.add_parser("list", help="List channel information")
-    list_subparsers = list_parser.add_subparsers(dest="list_cmd")
+    Args:
+        argv: Command-line arguments (without program name).
     
-    list_subparsers.add_parser("queue", help="Show current playlist")
-    list_subparsers.add_parser("users", help="Show online users")
-    list_subparsers.add_parser("emotes", help="Show channel emotes")
+    Returns:
+        False if argv must be handled by the full parser; otherwise the
+        process exits.
+    """
+    if not argv:
+        command, code = None, 1
+    elif argv in (["-h"], ["--help"]):
+        command, code = None, 0
+    elif len(argv) == 2 and argv[0] in _COMMANDS and argv[1] in ("-h", "--help"):
+        command, code = argv[0], 0
+    else:
+        return False
+    
+    print(_cached_help(command), end="")
+    sys.exit(code)
+
+
+# Command handlers by name; each returns the command's coroutine
+_PLAYLIST_DISPATCH = {
+    "add": lambda cli, a: cli.cmd_playlist_add(a.url),
+    "addnext": lambda cli, a: cli.cmd_playlist_addnext(a.url),
+    "del": lambda cli, a: cli.cmd_playlist_del(a.uid),
+    "move": lambda cli, a: cli.cmd_playlist_move(a.uid, a.after),
+    "jump": lambda cli, a: cli.cmd_playlist_jump(a.uid),
+    "clear": lambda cli, a: cli.cmd_playlist_clear(),
+    "shuffle": lambda cli, a: cli.cmd_playlist_shuffle(),
+    "settemp": lambda cli, a: cli.cmd_playlist_settemp(a.uid, a.temp == "true"),
+}
+
+_LIST_DISPATCH = {
+    "queue": lambda cli, a: cli.cmd_list_queue(),
+    "users": lambda cli, a: cli.cmd_list_users(),
+    "emotes": lambda cli, a: cli.cmd_list_emotes(),
+}
+
+_DISPATCH = {
+    "say": lambda cli, a: cli.cmd_say(a.message),
+    "pm": lambda cli, a: cli.cmd_pm(a.username, a.message),
+    "playlist": lambda cli, a: _dispatch_subcommand(cli, a, "playlist", a.playlist_cmd, _PLAYLIST_DISPATCH),
+    "pause": lambda cli, a: cli.cmd_pause(),
+    "play": lambda cli, a: cli.cmd_play(),
+    "seek": lambda cli, a: cli.cmd_seek(a.time),
+    "kick": lambda cli, a: cli.cmd_kick(a.username, a.reason),
+    "ban": lambda cli, a: cli.cmd_ban(a.username, a.reason),
+    "voteskip": lambda cli, a: cli.cmd_voteskip(),
+    "list": lambda cli, a: _dispatch_subcommand(cli, a, "list", a.list_cmd, _LIST_DISPATCH),
+    "batch": lambda cli, a: run_batch(cli, a.file),
+}
+
+
+async def _dispatch_subcommand(
+    cli: KrytenCLI,
+    args: argparse.Namespace,
+    command: str,
+    subcommand: Optional[str],
+    table: dict,
+) -> None:
+    """Run a nested subcommand, or show the command's help if none was given.
+    
+    Args:
+        cli: Connected CLI instance.
+        args: Parsed command-line arguments.
+        command: Parent command name (for help output).
+        subcommand: Subcommand name from args.
+        table: Handlers by subcommand name.
+    """
+    handler = table.get(subcommand)
+    if handler is None:
+        # Prints help and exits
+        create_parser(command).parse_args([command, "--help"])
+    else:
+        await handler(cli, args)
+
+
+async def dispatch(cli: KrytenCLI, args: argparse.Namespace) -> None:
+    """Route parsed arguments to the matching command handler.
     
-    return parser
+    Args:
+        cli: Connected CLI instance.
+        args: Parsed command-line arguments.
+    """
+    handler = _DISPATCH.get(args.command)
+    if handler is None:
+        print(f"Error: Unknown command '{args.command}'", file=sys.stderr)
+        sys.exit(1)
+    await handler(cli, args)
 
 
-async def main() -> None:
-    """Main entry point for CLI."""
-    parser = create_parser()
-    args = parser.parse_args()
+async def run_batch(cli: KrytenCLI, source: str) -> None:
+    """Run newline-separated commands over the already open connection.
+    
+    Each line is parsed like a ``kryten`` command line (without the program
+    name); blank lines and ``#`` comments are skipped. Commands run in order,
+    and a failing line is reported without stopping the rest. Only
+    ``--channel`` and ``--domain`` may be given per line; the connection
+    options (``--nats``, ``--config``, ``--daemon``) apply to the whole batch.
+    
+    Lines without ``--channel`` use the batch's channel. If the batch has
+    none either, it is auto-discovered once, on the first line that needs it.
     
-    if not args.command:
-        parser.print_help()
+    Args:
+        cli: Connected CLI instance.
+        source: Path to the command file, or ``-`` for stdin.
+    
+    Raises:
+        SystemExit: If the file cannot be read or any command failed.
+    """
+    try:
+        if source == "-":
+            text = sys.stdin.read()
+        else:
+            text = Path(source).read_text(encoding="utf-8")
+    except OSError as e:
+        print(f"Error: Cannot read batch file: {e}", file=sys.stderr)
         sys.exit(1)
     
-    # Auto-discover channel if not specified
-    channel = args.channel
+    channel, domain = cli.channel, cli.domain
+    discovery_failed = False
+    failures = 0
     
-    if not channel:
-        # Connect temporarily to discover channels
-        temp_cli = KrytenCLI(
-            channel="",  # Dummy channel for discovery
-            domain=args.domain,
-            nats_servers=args.nats_servers,
-            config_path=args.config,
-        )
-        
+    for line_no, line in enumerate(text.splitlines(), 1):
         try:
-            await temp_cli.connect()
+            argv = shlex.split(line, comments=True)
+            if not argv:
+                continue
             
-            # Discover channels
-            try:
-                channels = await temp_cli.client.get_channels(timeout=2.0)
-                
-                if not channels:
-                    print("Error: No channels found. Is Kryten-Robot running?", file=sys.stderr)
-                    print("  Start Kryten-Robot or specify --channel manually.", file=sys.stderr)
-                    sys.exit(1)
-                
-                if len(channels) == 1:
-                    # Single channel - use it automatically
-                    channel_info = channels[0]
-                    channel = channel_info["channel"]
-                    domain = channel_info["domain"]
-                    print(f"Auto-discovered channel: {domain}/{channel}")
+            args = _fast_parse(argv)
+            if args is None:
+                args = create_parser(_peek_command(argv)).parse_args(argv)
+            
+            if not args.command or args.command == "batch":
+                print(f"Line {line_no}: Error: Expected a command", file=sys.stderr)
+                failures += 1
+                continue
+            
+            if args.nats_servers is not None or args.config is not None or args.daemon:
+                print(
+                    f"Line {line_no}: Error: Only --channel and --domain may be set per line",
+                    file=sys.stderr,
+                )
+                failures += 1
+                continue
+            
+            _validate_args(args)
+            
+            # Lines may target another channel on the same connection
+            if args.channel:
+                cli.channel, cli.domain = args.channel, args.domain
+            else:
+                if not channel:
+                    if discovery_failed:
+                        print(f"Line {line_no}: Error: No channel; specify --channel", file=sys.stderr)
+                        failures += 1
+                        continue
                     
-                    # Update args with discovered values
-                    args.domain = domain
-                else:
-                    # Multiple channels - user must specify
-                    print("Error: Multiple channels found. Please specify --channel:", file=sys.stderr)
-                    for ch in channels:
-                        print(f"  {ch['domain']}/{ch['channel']}", file=sys.stderr)
-                    sys.exit(1)
+                    # Only tried once; its error is reported on this line
+                    discovery_failed = True
+                    channel, domain = await _discover_channel(cli)
+                    discovery_failed = False
                 
-            except TimeoutError:
-                print("Error: Channel discovery timed out. Is Kryten-Robot running?", file=sys.stderr)
-                print("  Start Kryten-Robot or specify --channel manually.", file=sys.stderr)
-                sys.exit(1)
-            except Exception as e:
-                print(f"Error: Channel discovery failed: {e}", file=sys.stderr)
-                print("  Specify --channel manually.", file=sys.stderr)
-                sys.exit(1)
+                cli.channel, cli.domain = channel, domain
+                args.domain = domain
             
-        finally:
-            await temp_cli.disconnect()
+            await dispatch(cli, args)
+        
+        except SystemExit as e:
+            if e.code:
+                print(f"Line {line_no}: Command failed", file=sys.stderr)
+                failures += 1
+        except Exception as e:
+            print(f"Line {line_no}: Error: {e}", file=sys.stderr)
+            failures += 1
+    
+    cli.channel, cli.domain = channel, domain
+    
+    if failures:
+        print(f"Error: {failures} batch command(s) failed", file=sys.stderr)
+        sys.exit(1)
+
+
+def _validate_args(args: argparse.Namespace) -> None:
+    """Reject malformed numeric arguments before connecting to NATS.
+    
+    Args:
+        args: Parsed command-line arguments.
+    
+    Raises:
+        SystemExit: If a UID or position is not an integer.
+    """
+    for name in ("uid", "after"):
+        value = getattr(args, name, None)
+        if value is None:
+            continue
+        try:
+            int(value)
+        except ValueError:
+            print(f"Error: Invalid UID or position '{value}' (expected a number)", file=sys.stderr)
+            sys.exit(1)
+
+
+async def _discover_channel(cli: KrytenCLI) -> tuple[str, str]:
+    """Discover the channel served by the running Kryten-Robot instance.
+    
+    Args:
+        cli: Connected CLI instance.
+    
+    Returns:
+        Tuple of (channel, domain).
+    
+    Raises:
+        SystemExit: If zero or several channels are found, or discovery fails.
+    """
+    try:
+        channels = await cli.client.get_channels(timeout=2.0)
+    except TimeoutError:
+        print("Error: Channel discovery timed out. Is Kryten-Robot running?", file=sys.stderr)
+        print("  Start Kryten-Robot or specify --channel manually.", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: Channel discovery failed: {e}", file=sys.stderr)
+        print("  Specify --channel manually.", file=sys.stderr)
+        sys.exit(1)
+    
+    if not channels:
+        print("Error: No channels found. Is Kryten-Robot running?", file=sys.stderr)
+        print("  Start Kryten-Robot or specify --channel manually.", file=sys.stderr)
+        sys.exit(1)
+    
+    if len(channels) > 1:
+        # Multiple channels - user must specify
+        print("Error: Multiple channels found. Please specify --channel:", file=sys.stderr)
+        for ch in channels:
+            print(f"  {ch['domain']}/{ch['channel']}", file=sys.stderr)
+        sys.exit(1)
+    
+    # Single channel - use it automatically
+    channel_info = channels[0]
+    channel = channel_info["channel"]
+    domain = channel_info["domain"]
+    print(f"Auto-discovered channel: {domain}/{channel}")
+    return channel, domain
+
+
+async def main() -> None:
+    """Main entry point for CLI."""
+    args = _fast_parse(sys.argv[1:])
+    if args is None:
+        parser = create_parser(_peek_command(sys.argv[1:]))
+        args = parser.parse_args()
+        
+        if not args.command:
+            parser.print_help()
+            sys.exit(1)
     
-    # Initialize CLI with discovered or specified channel
+    _validate_args(args)
+    
+    # Batch input is read by this process, so it never goes to the daemon
+    use_daemon = args.command != "batch" and (
+        args.daemon or os.environ.get("KRYTEN_DAEMON") == "1"
+    )
+    if use_daemon:
+        import kryten_daemon
+        
+        use_daemon = kryten_daemon.is_supported()
+    
+    if use_daemon:
+        # Hand the command to a running daemon if there is one
+        reply = kryten_daemon.send(kryten_daemon.settings_for(args, args.channel), vars(args))
+        if reply is not None:
+            sys.stdout.write(reply["stdout"])
+            sys.stderr.write(reply["stderr"])
+            sys.exit(reply["code"])
+    
+    # Connect once; the same connection serves discovery and the command
     cli = KrytenCLI(
-        channel=channel,
+        channel=args.channel or "",  # Dummy channel until discovered
         domain=args.domain,
         nats_servers=args.nats_servers,
         config_path=args.config,
     )
-    
-    # Connect to NATS
     await cli.connect()
     
     try:
-        # Route to appropriate command handler
-        if args.command == "say":
-            await cli.cmd_say(args.message)
-        
-        elif args.command == "pm":
-            await cli.cmd_pm(args.username, args.message)
-        
-        elif args.command == "playlist":
-            if args.playlist_cmd == "add":
-                await cli.cmd_playlist_add(args.url)
-            elif args.playlist_cmd == "addnext":
-                await cli.cmd_playlist_addnext(args.url)
-            elif args.playlist_cmd == "del":
-                await cli.cmd_playlist_del(args.uid)
-            elif args.playlist_cmd == "move":
-                await cli.cmd_playlist_move(args.uid, args.after)
-            elif args.playlist_cmd == "jump":
-                await cli.cmd_playlist_jump(args.uid)
-            elif args.playlist_cmd == "clear":
-                await cli.cmd_playlist_clear()
-            elif args.playlist_cmd == "shuffle":
-                await cli.cmd_playlist_shuffle()
-            elif args.playlist_cmd == "settemp":
-                temp_bool = args.temp == "true"
-                await cli.cmd_playlist_settemp(args.uid, temp_bool)
-            else:
-                parser.parse_args(["playlist", "--help"])
-        
-        elif args.command == "pause":
-            await cli.cmd_pause()
-        
-        elif args.command == "play":
-            await cli.cmd_play()
-        
-        elif args.command == "seek":
-            await cli.cmd_seek(args.time)
-        
-        elif args.command == "kick":
-            await cli.cmd_kick(args.username, args.reason)
-        
-        elif args.command == "ban":
-            await cli.cmd_ban(args.username, args.reason)
-        
-        elif args.command == "voteskip":
-            await cli.cmd_voteskip()
-        
-        elif args.command == "list":
-            if args.list_cmd == "queue":
-                await cli.cmd_list_queue()
-            elif args.list_cmd == "users":
-                await cli.cmd_list_users()
-            elif args.list_cmd == "emotes":
-                await cli.cmd_list_emotes()
-            else:
-                parser.parse_args(["list", "--help"])
+        # Auto-discover channel if not specified (batch lines may name
+        # their own, so run_batch discovers only when a line needs it)
+        if not args.channel and args.command != "batch":
+            cli.channel, cli.domain = await _discover_channel(cli)
+            
+            # Update args with discovered values
+            args.domain = cli.domain
         
-        else:
-            print(f"Error: Unknown command '{args.command}'", file=sys.stderr)
-            sys.exit(1)
-    
+        await dispatch(cli, args)
     finally:
         await cli.disconnect()
+    
+    if use_daemon:
+        # Keep a connection warm for the next invocation
+        kryten_daemon.spawn(kryten_daemon.settings_for(args, cli.channel))
+
+
+def _async_runner():
+    """Get the function used to run the top-level coroutine.
+    
+    Returns:
+        ``uvloop.run`` when uvloop is installed, otherwise ``asyncio.run``.
+    """
+    try:
+        # Optional libuv event loop (pip install kryten-cli[fast])
+        import uvloop
+        
+        return uvloop.run
+    except ImportError:
+        import asyncio
+        
+        return asyncio.run
 
 
 def run() -> None:
     """Entry point wrapper for setuptools."""
+    print_from_static(sys.argv[1:])
+    
     try:
-        asyncio.run(main())
+        _async_runner()(main())
     except KeyboardInterrupt:
         print("\nAborted.", file=sys.stderr)
         sys.exit(130)
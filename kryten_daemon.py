@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""Kryten CLI daemon - Reuse one NATS connection across invocations.
+
+Opening a NATS connection dominates the run time of a single ``kryten``
+command. With ``--daemon`` (or ``KRYTEN_DAEMON=1``), the first invocation
+runs normally and then starts this module in the background. The daemon
+connects once and executes the commands that later invocations send over a
+per-user Unix socket, replying with their output and exit code.
+
+A daemon serves one set of connection settings (config file and NATS
+servers); different settings get a different socket. It exits after
+IDLE_TIMEOUT seconds without a request. POSIX only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import io
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+# Seconds without a request before the daemon shuts down
+IDLE_TIMEOUT = 600.0
+
+# Seconds a client waits for a reply once its command has been sent
+REPLY_TIMEOUT = 60.0
+
+
+def is_supported() -> bool:
+    """Check whether this platform supports the daemon."""
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "getuid")
+
+
+def settings_for(args: argparse.Namespace, channel: Optional[str]) -> dict:
+    """Build daemon settings from parsed command-line arguments.
+    
+    Args:
+        args: Parsed command-line arguments.
+        channel: Channel the daemon should default to.
+    
+    Returns:
+        JSON-serializable settings dictionary.
+    """
+    config = None
+    config_mtime = None
+    if args.config and Path(args.config).exists():
+        config_path = Path(args.config).resolve()
+        config = str(config_path)
+        config_mtime = config_path.stat().st_mtime_ns
+    
+    return {
+        "config": config,
+        "config_mtime": config_mtime,
+        "nats_servers": args.nats_servers,
+        "channel": channel,
+        "domain": args.domain,
+    }
+
+
+def _runtime_dir() -> Optional[Path]:
+    """Get a directory for sockets that only the current user can access.
+    
+    Uses ``$XDG_RUNTIME_DIR``, or else creates ``kryten-<uid>`` in the
+    temporary directory with mode 0700.
+    
+    Returns:
+        Path of the directory, or None if it is not owned by the current
+        user or is accessible to others.
+    """
+    uid = os.getuid()
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        path = Path(runtime_dir)
+    else:
+        path = Path(tempfile.gettempdir()) / f"kryten-{uid}"
+        try:
+            path.mkdir(mode=0o700, exist_ok=True)
+        except OSError:
+            return None
+    
+    # Never trust a directory someone else could have planted or can write to
+    try:
+        st = path.lstat()
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != uid or st.st_mode & 0o077:
+        return None
+    return path
+
+
+def socket_path(settings: dict) -> Optional[Path]:
+    """Get the socket path for a set of connection settings.
+    
+    Args:
+        settings: Settings from settings_for().
+    
+    Returns:
+        Path of the Unix socket in the user's runtime directory, or None if
+        no private runtime directory is available.
+    """
+    runtime_dir = _runtime_dir()
+    if runtime_dir is None:
+        return None
+    
+    key = json.dumps(
+        [settings["config"], settings["config_mtime"], settings["nats_servers"]]
+    )
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+    return runtime_dir / f"kryten-{digest}.sock"
+
+
+def send(settings: dict, frame: dict) -> Optional[dict]:
+    """Send one command to a running daemon.
+    
+    Args:
+        settings: Settings from settings_for().
+        frame: Parsed arguments of the command (``vars(args)``).
+    
+    Returns:
+        Reply with ``code``, ``stdout`` and ``stderr`` keys, or None if no
+        daemon is listening or it has lost its NATS connection (the caller
+        should run the command itself).
+    """
+    path = socket_path(settings)
+    if path is None:
+        return None
+    
+    # Only talk to a socket created by the current user
+    try:
+        st = path.lstat()
+    except OSError:
+        return None
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        return None
+    
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return None
+        
+        # From here on the command may have run, so never report "no daemon"
+        try:
+            sock.settimeout(REPLY_TIMEOUT)
+            sock.sendall(json.dumps(frame).encode("utf-8"))
+            sock.shutdown(socket.SHUT_WR)
+            
+            chunks = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+            reply = json.loads(b"".join(chunks))
+        except (OSError, ValueError) as e:
+            return {"code": 1, "stdout": "", "stderr": f"Error: No reply from daemon: {e}\n"}
+    finally:
+        sock.close()
+    
+    # The daemon is shutting down without having run the command
+    if reply.get("unavailable"):
+        return None
+    return reply
+
+
+def spawn(settings: dict) -> None:
+    """Start a daemon in a new session, detached from this process.
+    
+    Args:
+        settings: Settings from settings_for().
+    """
+    if socket_path(settings) is None:
+        return
+    
+    try:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), json.dumps(settings)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        # The daemon is an optimization; the command itself already ran
+        pass
+
+
+async def _execute(cli, frame: dict) -> dict:
+    """Run one command frame, capturing its output and exit code.
+    
+    Args:
+        cli: Connected KrytenCLI instance.
+        frame: Parsed arguments of the command.
+    
+    Returns:
+        Reply dictionary for send().
+    """
+    from kryten_cli import _discover_channel, dispatch
+    
+    args = argparse.Namespace(**frame)
+    
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    code = 0
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            if args.channel:
+                cli.channel = args.channel
+                cli.domain = args.domain
+            else:
+                # Discover per command, exactly as a direct run would
+                cli.channel, cli.domain = await _discover_channel(cli)
+                args.domain = cli.domain
+            
+            await dispatch(cli, args)
+        except SystemExit as e:
+            if isinstance(e.code, int):
+                code = e.code
+            elif e.code is not None:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            code = 1
+    
+    return {"code": code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+async def serve(settings: dict) -> None:
+    """Connect once and serve commands until idle.
+    
+    Args:
+        settings: Settings from settings_for().
+    """
+    from kryten_cli import KrytenCLI
+    
+    path = socket_path(settings)
+    if path is None:
+        return
+    
+    # Another daemon may have won the race to start
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+        return
+    except OSError:
+        path.unlink(missing_ok=True)
+    finally:
+        probe.close()
+    
+    cli = KrytenCLI(
+        channel=settings["channel"],
+        domain=settings["domain"],
+        nats_servers=settings["nats_servers"],
+        config_path=settings["config"],
+    )
+    await cli.connect()
+    
+    loop = asyncio.get_running_loop()
+    lock = asyncio.Lock()
+    stop = asyncio.Event()
+    last_used = loop.time()
+    
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        nonlocal last_used
+        try:
+            frame = json.loads(await reader.read())
+            async with lock:
+                if cli.client.is_connected:
+                    reply = await _execute(cli, frame)
+                else:
+                    # NATS gave up reconnecting; hand the command back and exit
+                    reply = {"unavailable": True}
+                    stop.set()
+            writer.write(json.dumps(reply).encode("utf-8"))
+            await writer.drain()
+        except (OSError, ValueError):
+            pass
+        finally:
+            last_used = loop.time()
+            writer.close()
+    
+    # Socket is only accessible to the current user
+    old_umask = os.umask(0o077)
+    try:
+        server = await asyncio.start_unix_server(handle, path=str(path))
+    finally:
+        os.umask(old_umask)
+    
+    try:
+        while lock.locked() or loop.time() - last_used < IDLE_TIMEOUT:
+            if not cli.client.is_connected:
+                break
+            try:
+                await asyncio.wait_for(stop.wait(), min(IDLE_TIMEOUT, 30.0))
+                break
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
+        await cli.disconnect()
+
+
+if __name__ == "__main__":
+    from kryten_cli import _async_runner
+    
+    _async_runner()(serve(json.loads(sys.argv[1])))
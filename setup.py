@@ -1,5 +1,6 @@
 """Setup script for Kryten CLI."""
 
+import os
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -7,6 +8,20 @@ from pathlib import Path
 this_directory = Path(__file__).parent
 long_description = (this_directory / "README.md").read_text(encoding="utf-8")
 
+# Optional ahead-of-time compilation of the CLI module with mypyc:
+#   pip install mypy && KRYTEN_CLI_MYPYC=1 pip install --no-build-isolation .
+ext_modules = []
+if os.environ.get("KRYTEN_CLI_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify([
+        "kryten_cli.py",
+        "--ignore-missing-imports",
+        "--explicit-package-bases",
+        # KrytenCLI.client is only None before connect()
+        "--disable-error-code=union-attr",
+    ])
+
 setup(
     name="kryten-cli",
     version="2.3.0",
@@ -23,10 +38,16 @@ setup(
     },
     license="MIT",
     packages=find_packages(),
-    py_modules=["kryten_cli"],
+    py_modules=["kryten_cli", "kryten_daemon"],
+    ext_modules=ext_modules,
     install_requires=[
         "kryten-py>=0.5.8",
     ],
+    extras_require={
+        "fast": [
+            "uvloop>=0.18; platform_system != 'Windows'",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "kryten=kryten_cli:run",